@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+JAWS DAYS 2026 Timetable Asset Builder
+
+public/ の静的ファイルをデプロイ用に dist/ へ出力するスクリプト。
+
+  - app.js / style.css をコンテンツハッシュ付きのファイル名 (例: app.1a2b3c4d5e.js) に変更し、
+    index.html の参照を書き換える。ハッシュ付きファイルは内容が変わらない限り同じ URL のため、
+    長期間キャッシュしてよい。
+  - search-index.json を dist/timetable.json から生成する。デプロイされるインデックスの
+    唯一の生成元であり、常にデプロイするデータと一致する。
+  - Service Worker (sw.js) の self.__PRECACHE_MANIFEST をプリキャッシュ一覧に置き換える。
+    一覧には index.html、ハッシュ付きアセット、timetable.json、search-index.json を含む。
+    名前が固定のファイルには revision (コンテンツハッシュ) を付与し、
+    Service Worker は revision が変わったファイルだけを再取得する。
+
+  スピーカー画像 (fortee.jp) はプリキャッシュせず、Service Worker が表示時に別キャッシュへ
+  保存する (不透明レスポンスはストレージ容量を大きく消費し、インストール失敗の原因になるため)。
+
+  updates/ (live_updates.py の差分パッチ) は常にネットワークから取得するため対象外。
+
+使い方:
+  python build_assets.py
+
+出力:
+  dist/
+"""
+
+import hashlib
+import json
+import re
+import shutil
+import sys
+from pathlib import Path
+
+from search_index import build_search_index, write_search_index
+
+PUBLIC_DIR = Path(__file__).parent / "public"
+DIST_DIR = Path(__file__).parent / "dist"
+HASH_LENGTH = 10
+
+# ファイル名にハッシュを付与するアセット (index.html から参照される)
+FINGERPRINT_ASSETS = ("app.js", "style.css")
+# 名前を固定したまま revision 付きでプリキャッシュするデータ (app.js から参照される)
+PRECACHE_DATA = ("timetable.json", "search-index.json")
+INDEX_HTML = "index.html"
+SERVICE_WORKER = "sw.js"
+MANIFEST_PLACEHOLDER = "self.__PRECACHE_MANIFEST"
+
+
+def content_hash(data):
+    """バイト列のコンテンツハッシュ (SHA-256 の先頭 HASH_LENGTH 文字) を返す"""
+    return hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+
+
+def fingerprint_name(name, digest):
+    """ファイル名の拡張子の前にハッシュを挿入する (app.js → app.<hash>.js)"""
+    stem, _, ext = name.rpartition(".")
+    return f"{stem}.{digest}.{ext}"
+
+
+def rewrite_references(html, renamed):
+    """HTML の href / src 属性が参照するファイル名を書き換える"""
+    for original, hashed in renamed.items():
+        html = re.sub(
+            rf'((?:href|src)=")(?:\./)?{re.escape(original)}(")',
+            rf"\g<1>{hashed}\g<2>",
+            html,
+        )
+    return html
+
+
+def build_assets(public_dir=PUBLIC_DIR, dist_dir=DIST_DIR):
+    """dist/ を生成し、プリキャッシュ一覧 ([{"url", "revision"}]) を返す"""
+    if dist_dir.exists():
+        shutil.rmtree(dist_dir)
+    shutil.copytree(public_dir, dist_dir)
+
+    timetable = json.loads((dist_dir / "timetable.json").read_text(encoding="utf-8"))
+    write_search_index(build_search_index([timetable]), dist_dir / "search-index.json")
+
+    renamed = {}
+    hashed_entries = []
+    for name in FINGERPRINT_ASSETS:
+        path = dist_dir / name
+        hashed = fingerprint_name(name, content_hash(path.read_bytes()))
+        path.rename(dist_dir / hashed)
+        renamed[name] = hashed
+        # URL 自体にハッシュを含むので revision は不要
+        hashed_entries.append({"url": hashed, "revision": None})
+
+    index_path = dist_dir / INDEX_HTML
+    html = rewrite_references(index_path.read_text(encoding="utf-8"), renamed)
+    for name, hashed in renamed.items():
+        if hashed not in html:
+            raise ValueError(f"{INDEX_HTML} に {name} の参照が見つかりません")
+    index_path.write_text(html, encoding="utf-8")
+
+    precache = [{"url": INDEX_HTML, "revision": content_hash(html.encode("utf-8"))}]
+    precache.extend(hashed_entries)
+    for name in PRECACHE_DATA:
+        path = dist_dir / name
+        if path.exists():
+            precache.append({"url": name, "revision": content_hash(path.read_bytes())})
+
+    sw_path = dist_dir / SERVICE_WORKER
+    sw = sw_path.read_text(encoding="utf-8")
+    if MANIFEST_PLACEHOLDER not in sw:
+        raise ValueError(f"{SERVICE_WORKER} に {MANIFEST_PLACEHOLDER} が見つかりません")
+    sw_path.write_text(
+        sw.replace(MANIFEST_PLACEHOLDER, json.dumps(precache, ensure_ascii=False)),
+        encoding="utf-8",
+    )
+
+    return precache
+
+
+def main():
+    try:
+        precache = build_assets()
+    except Exception as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    print(f"Success: {len(precache)} precache entries written to {DIST_DIR / SERVICE_WORKER}")
+    for entry in precache:
+        print(f"  {entry['url']}" + (f" (revision {entry['revision']})" if entry["revision"] else ""))
+
+
+if __name__ == "__main__":
+    main()
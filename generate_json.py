@@ -1,6 +1,10 @@
 #!/usr/bin/env python3
-"""Generate timetable.json from hardcoded session data extracted from fortee.jp HTML."""
-import json
+"""Generate timetable.json from hardcoded session data extracted from fortee.jp HTML.
+
+Writes public/timetable.json through live_updates.save_timetable so the live update
+version and patches stay consistent with the published data.
+"""
+from live_updates import TIMETABLE_PATH, save_timetable
 
 def top_to_time(top_px):
     """Convert CSS top px to start time string. 0px = 09:00, 6px = 1 min."""
@@ -262,10 +266,9 @@ output = {
     "sessions": final_sessions
 }
 
-with open("/home/user/aws-jawsdays2026-timetable-unofficial/docs/timetable.json", "w", encoding="utf-8") as f:
-    json.dump(output, f, ensure_ascii=False, indent=2)
+version = save_timetable(output)
 
-print(f"Generated {len(final_sessions)} sessions")
+print(f"Generated {len(final_sessions)} sessions (version {version}) to {TIMETABLE_PATH}")
 # Print summary per track
 for track_id in "ABCDEFGH":
     track_sessions = [s for s in final_sessions if s["track"] == track_id]
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+JAWS DAYS 2026 Timetable Live Update Publisher
+
+新しい timetable.json の内容を直前の内容と比較し、RFC 6902 (JSON Patch) 形式の
+差分ファイルとバージョン付きマニフェストを生成するスクリプト。
+
+当日のルーム変更やキャンセルがあっても、クライアントはマニフェストをポーリングして
+差分だけを取得・適用すればよく、timetable.json 全体を再取得する必要がありません。
+
+出力:
+  public/updates/manifest.json
+    {
+      "version": 3,
+      "patches": [{"from": 2, "to": 3, "file": "patch-3.json"}, ...]
+    }
+  public/updates/patch-N.json
+    {"from": N-1, "to": N, "ops": [{"op": "replace", "path": "/sessions/4/track", "value": "B"}, ...]}
+
+  timetable.json にはトップレベルの "version" が付与されます (未設定の場合は 0 とみなす)。
+  バージョンは timetable.json とマニフェストの大きい方を基準にし、減ることはありません。
+  timetable.json が公開済みのバージョンより古い (バージョンなしのコピーで上書きされた等) 場合は
+  正しい差分を作れないため、パッチなしでバージョンだけを進め、クライアントに再取得させます。
+  セッションは proposalUrl (汎用スロットは title + speaker) で前回のセッションと対応付け、
+  対応するセッションは前回の id と配列上の位置を引き継ぎます。新規セッションは末尾に追加され、
+  新しい id が割り当てられます。これにより id (参加予定のクッキー・共有 URL) が更新で
+  ずれることはなく、パッチも実際に変わったセッションの分だけになります。
+  マニフェストには直近 MAX_PATCHES 件のパッチのみ残し、それより古いバージョンの
+  クライアントは timetable.json を再取得します。
+
+使い方:
+  python live_updates.py new_timetable.json
+
+  scraper.py / generate_json.py も save_timetable() 経由で差分を公開します。
+  public/timetable.json を直接上書きしないでください。
+"""
+
+import json
+import sys
+from pathlib import Path
+
+TIMETABLE_PATH = Path(__file__).parent / "public" / "timetable.json"
+UPDATES_DIR = Path(__file__).parent / "public" / "updates"
+MANIFEST_NAME = "manifest.json"
+MAX_PATCHES = 50
+
+# バージョン番号は差分の対象外
+VERSION_KEY = "version"
+SESSIONS_KEY = "sessions"
+# スクレイパーが取得できなかった (空の) 場合に前回の値を引き継ぐフィールド
+CARRY_OVER_FIELDS = ("speakerImage",)
+
+
+def escape_pointer(key):
+    """JSON Pointer (RFC 6901) 用にキーをエスケープする"""
+    return str(key).replace("~", "~0").replace("/", "~1")
+
+
+def json_diff(old, new, path=""):
+    """2つの JSON 値の差分を RFC 6902 の操作リストとして返す"""
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops = []
+        for key in old:
+            if key not in new:
+                ops.append({"op": "remove", "path": f"{path}/{escape_pointer(key)}"})
+        for key, value in new.items():
+            child = f"{path}/{escape_pointer(key)}"
+            if key in old:
+                ops.extend(json_diff(old[key], value, child))
+            else:
+                ops.append({"op": "add", "path": child, "value": value})
+        return ops
+
+    if isinstance(old, list) and isinstance(new, list):
+        ops = []
+        common = min(len(old), len(new))
+        for i in range(common):
+            ops.extend(json_diff(old[i], new[i], f"{path}/{i}"))
+        for value in new[common:]:
+            ops.append({"op": "add", "path": f"{path}/-", "value": value})
+        # 後ろから削除してインデックスのずれを防ぐ
+        for i in range(len(old) - 1, common - 1, -1):
+            ops.append({"op": "remove", "path": f"{path}/{i}"})
+        return ops
+
+    if old != new or type(old) is not type(new):
+        return [{"op": "replace", "path": path, "value": new}]
+    return []
+
+
+def strip_version(timetable):
+    """バージョン番号とセッション一覧を除いた timetable のコピーを返す"""
+    return {k: v for k, v in timetable.items() if k not in (VERSION_KEY, SESSIONS_KEY)}
+
+
+def session_key(session):
+    """前回のセッションと対応付けるためのキー (proposalUrl、汎用スロットは title + speaker)"""
+    return session.get("proposalUrl") or (session.get("title"), session.get("speaker"))
+
+
+def align_sessions(old_sessions, new_sessions):
+    """新しいセッション一覧を前回の並び順・id に揃える
+
+    対応するセッションは前回の位置に並べて id を引き継ぐ。新しい側に存在しないフィールドと、
+    CARRY_OVER_FIELDS のうち空のフィールドは前回の値を引き継ぐ
+    (スクレイパーが出力しないデータをパッチで消さないため)。
+    新規セッションは末尾に並べて新しい id を割り当てる。
+    (揃えたセッション一覧, 削除された前回のインデックス一覧) を返す。
+    """
+    candidates = {}
+    for i, s in enumerate(old_sessions):
+        candidates.setdefault(session_key(s), []).append(i)
+
+    # 休憩などキーが重複する場合は、同じトラック・開始時刻のものを優先して対応付ける
+    matched = {}
+    for j, s in enumerate(new_sessions):
+        pool = candidates.get(session_key(s), [])
+        for i in pool:
+            if old_sessions[i]["track"] == s["track"] and old_sessions[i]["start"] == s["start"]:
+                matched[i] = j
+                pool.remove(i)
+                break
+    matched_new = set(matched.values())
+    for j, s in enumerate(new_sessions):
+        if j in matched_new:
+            continue
+        pool = candidates.get(session_key(s), [])
+        if pool:
+            matched[pool.pop(0)] = j
+            matched_new.add(j)
+
+    aligned = []
+    removed = []
+    for i, old in enumerate(old_sessions):
+        if i not in matched:
+            removed.append(i)
+            continue
+        session = new_sessions[matched[i]]
+        for key, value in old.items():
+            if key not in session or (key in CARRY_OVER_FIELDS and not session[key]):
+                session[key] = value
+        session["id"] = old["id"]
+        aligned.append(session)
+
+    next_id = max((s["id"] for s in old_sessions), default=0) + 1
+    for j, session in enumerate(new_sessions):
+        if j not in matched_new:
+            session["id"] = next_id
+            next_id += 1
+            aligned.append(session)
+
+    return aligned, removed
+
+
+def diff_sessions(old_sessions, aligned, removed):
+    """align_sessions の結果からセッション一覧の RFC 6902 操作リストを返す"""
+    # 後ろから削除してインデックスのずれを防ぐ
+    ops = [{"op": "remove", "path": f"/{SESSIONS_KEY}/{i}"} for i in reversed(removed)]
+    removed_set = set(removed)
+    kept = [s for i, s in enumerate(old_sessions) if i not in removed_set]
+    for j, (old, new) in enumerate(zip(kept, aligned)):
+        ops.extend(json_diff(old, new, f"/{SESSIONS_KEY}/{j}"))
+    for session in aligned[len(kept):]:
+        ops.append({"op": "add", "path": f"/{SESSIONS_KEY}/-", "value": session})
+    return ops
+
+
+def load_json(path, default=None):
+    """JSON ファイルを読み込む。存在しない場合は default を返す"""
+    if not path.exists():
+        return default
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def write_json(path, data):
+    """コンパクトな JSON として書き出す"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        json.dumps(data, ensure_ascii=False, separators=(",", ":")),
+        encoding="utf-8",
+    )
+
+
+def publish_update(output, timetable_path=TIMETABLE_PATH, updates_dir=UPDATES_DIR):
+    """直前の timetable.json との差分をパッチとして公開し、output にバージョンを付与する
+
+    output のセッション一覧は前回の並び順・id に揃えられる (align_sessions)。
+    変更がなければパッチは生成せず、直前のバージョンをそのまま引き継ぐ。
+    バージョンは公開済みのバージョン (マニフェスト) より小さくならない。
+    付与したバージョン番号を返す。
+    """
+    previous = load_json(timetable_path)
+    manifest_path = updates_dir / MANIFEST_NAME
+    manifest = load_json(manifest_path, {"version": 0, "patches": []})
+    published = manifest["version"]
+    base = previous.get(VERSION_KEY, 0) if previous is not None else 0
+
+    if base < published:
+        # timetable.json が公開済みの状態と一致しないため、パッチの連鎖を切って再取得させる
+        for stale in manifest["patches"]:
+            (updates_dir / stale["file"]).unlink(missing_ok=True)
+        version = published + 1
+        write_json(manifest_path, {"version": version, "patches": []})
+        output[VERSION_KEY] = version
+        return version
+
+    version = base
+    ops = []
+    if previous is not None:
+        old_sessions = previous.get(SESSIONS_KEY, [])
+        aligned, removed = align_sessions(old_sessions, output.get(SESSIONS_KEY, []))
+        output[SESSIONS_KEY] = aligned
+        ops = json_diff(strip_version(previous), strip_version(output))
+        ops.extend(diff_sessions(old_sessions, aligned, removed))
+
+    if ops:
+        version += 1
+        patch_name = f"patch-{version}.json"
+        write_json(updates_dir / patch_name, {"from": version - 1, "to": version, "ops": ops})
+
+        patches = manifest["patches"] + [{"from": version - 1, "to": version, "file": patch_name}]
+        for expired in patches[:-MAX_PATCHES]:
+            (updates_dir / expired["file"]).unlink(missing_ok=True)
+        write_json(manifest_path, {"version": version, "patches": patches[-MAX_PATCHES:]})
+    elif not manifest_path.exists() or published != version:
+        write_json(manifest_path, {"version": version, "patches": manifest["patches"]})
+
+    output[VERSION_KEY] = version
+    return version
+
+
+def save_timetable(output, timetable_path=TIMETABLE_PATH, updates_dir=UPDATES_DIR):
+    """差分を公開してから timetable.json を書き出す。付与したバージョン番号を返す"""
+    version = publish_update(output, timetable_path, updates_dir)
+    timetable_path.parent.mkdir(parents=True, exist_ok=True)
+    timetable_path.write_text(
+        json.dumps(output, ensure_ascii=False, indent=2),
+        encoding="utf-8",
+    )
+    return version
+
+
+def main():
+    if len(sys.argv) != 2:
+        print("Usage: python live_updates.py new_timetable.json")
+        sys.exit(1)
+
+    output = json.loads(Path(sys.argv[1]).read_text(encoding="utf-8"))
+    version = save_timetable(output)
+    print(f"Success: timetable version {version} saved to {TIMETABLE_PATH}")
+
+
+if __name__ == "__main__":
+    main()
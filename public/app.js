@@ -11,6 +11,8 @@
   const SLOT_MINUTES = 5;
   const CURRENT_CHECK_INTERVAL = 60000; // 1 minute
   const SCROLL_TOP_THRESHOLD = 400; // px scrolled before showing button
+  const UPDATES_DIR = "updates/";
+  const UPDATES_MANIFEST_URL = UPDATES_DIR + "manifest.json";
 
   // --- Debug Mode ---
   const isDebugMode = new URLSearchParams(window.location.search).get("mode") === "debug";
@@ -22,6 +24,11 @@
   let editMode = false;
   let debugDate = null; // Debug mode: virtual current date (null = use real time)
   let isViewingShared = false; // True when showing shared URL content (not own cookie data)
+  let searchIndex = null; // Inverted index from search-index.json (null = search unavailable)
+  let searchCharPostings = new Map(); // single char -> postings, derived from searchIndex.grams
+  const searchTextCache = new Map(); // session id -> normalized search text
+  let manifestEtag = null; // ETag of the last fetched updates manifest
+  let isCheckingUpdates = false;
 
   // --- DOM refs ---
   const timetableEl = document.getElementById("timetable");
@@ -47,6 +54,9 @@
   const hamburgerBtn = document.getElementById("hamburger-btn");
   const headerNav = document.getElementById("header-nav");
   const shareUrlBtn = document.getElementById("share-url-btn");
+  const searchBox = document.getElementById("search-box");
+  const searchInput = document.getElementById("search-input");
+  const searchTagSelect = document.getElementById("search-tag");
 
   // --- Utility: Current date (debug-aware) ---
   // Returns the "current" Date. In debug mode, returns the virtual time set via UI.
@@ -293,6 +303,94 @@
     );
   }
 
+  // --- Build a single session cell (null when it cannot be placed on the grid) ---
+  function createSessionCell(session) {
+    const trackIdx = timetableData.tracks.findIndex((t) => t.id === session.track);
+    if (trackIdx === -1) return null;
+
+    const startRow = timeToRow(session.start) + 2; // +2 for header offset
+    const span = session.duration / SLOT_MINUTES;
+
+    if (startRow < 2 || span <= 0) return null;
+
+    const cell = document.createElement("div");
+    cell.className = "session-cell";
+    cell.dataset.sessionId = session.id;
+    cell.style.gridColumn = `${trackIdx + 2}`;
+    cell.style.gridRow = `${startRow} / span ${span}`;
+
+    // Non-session check (breaks, registration, etc.)
+    // オープニング・キーノート・懇親会は選択可能なので除外
+    const isNonSession =
+      !session.proposalUrl &&
+      (session.title.includes("休憩") ||
+        session.title.includes("受付") ||
+        session.title.includes("会場レイアウト変更"));
+
+    if (isNonSession) {
+      cell.classList.add("non-session");
+    }
+
+    // Checked state
+    if (checkedSessions.has(session.id)) {
+      cell.classList.add("checked");
+    }
+
+    // Current state
+    if (isSessionCurrent(session)) {
+      cell.classList.add("current");
+    }
+
+    // Tags HTML: ランチタグを先頭に追加し、Level/サポーターなどのタグを続ける
+    const tagItems = [];
+    if (isLunchSession(session)) {
+      tagItems.push(`<span class="session-tag lunch-tag" aria-label="ランチセッション">🍴</span>`);
+    }
+    if (session.tags && session.tags.length > 0) {
+      session.tags.forEach((t) => {
+        const cls = getTagClass(t);
+        tagItems.push(`<span class="session-tag${cls ? " " + cls : ""}">${escapeHtml(t)}</span>`);
+      });
+    }
+    const tagsHtml = tagItems.length > 0
+      ? `<span class="session-tags">${tagItems.join("")}</span>`
+      : "";
+
+    // Speaker with avatar
+    let speakerHtml = "";
+    if (session.speaker) {
+      const avatarHtml = session.speakerImage
+        ? `<img class="session-speaker-avatar" src="${escapeHtml(session.speakerImage)}" alt="${escapeHtml(session.speaker)}" loading="lazy">`
+        : "";
+      speakerHtml = `<span class="session-speaker">${avatarHtml}${escapeHtml(session.speaker)}</span>`;
+    }
+
+    // Checkbox - only for non-break sessions
+    const checkboxHtml = !isNonSession
+      ? `<input type="checkbox" class="session-check" ${checkedSessions.has(session.id) ? "checked" : ""} data-session-id="${session.id}">`
+      : "";
+
+    // Content: 時間 → タグ → タイトル → 登壇者 の順
+    cell.innerHTML = `
+      <span class="session-time-label">${session.start}-${session.end}</span>
+      ${tagsHtml}
+      <span class="session-title">${escapeHtml(session.title)}</span>
+      ${speakerHtml}
+      ${checkboxHtml}
+    `;
+
+    // Click handler
+    if (!isNonSession) {
+      cell.addEventListener("click", (e) => {
+        if (editMode) return;
+        if (e.target.classList.contains("session-check")) return;
+        openModal(session);
+      });
+    }
+
+    return cell;
+  }
+
   // --- Render Timetable ---
   function renderTimetable() {
     if (!timetableData) return;
@@ -351,90 +449,8 @@
 
     // Place sessions on grid
     sessions.forEach((session) => {
-      const trackIdx = tracks.findIndex((t) => t.id === session.track);
-      if (trackIdx === -1) return;
-
-      const startRow = timeToRow(session.start) + 2; // +2 for header offset
-      const span = session.duration / SLOT_MINUTES;
-
-      if (startRow < 2 || span <= 0) return;
-
-      const cell = document.createElement("div");
-      cell.className = "session-cell";
-      cell.dataset.sessionId = session.id;
-      cell.style.gridColumn = `${trackIdx + 2}`;
-      cell.style.gridRow = `${startRow} / span ${span}`;
-
-      // Non-session check (breaks, registration, etc.)
-      // オープニング・キーノート・懇親会は選択可能なので除外
-      const isNonSession =
-        !session.proposalUrl &&
-        (session.title.includes("休憩") ||
-          session.title.includes("受付") ||
-          session.title.includes("会場レイアウト変更"));
-
-      if (isNonSession) {
-        cell.classList.add("non-session");
-      }
-
-      // Checked state
-      if (checkedSessions.has(session.id)) {
-        cell.classList.add("checked");
-      }
-
-      // Current state
-      if (isSessionCurrent(session)) {
-        cell.classList.add("current");
-      }
-
-      // Tags HTML: ランチタグを先頭に追加し、Level/サポーターなどのタグを続ける
-      const tagItems = [];
-      if (isLunchSession(session)) {
-        tagItems.push(`<span class="session-tag lunch-tag" aria-label="ランチセッション">🍴</span>`);
-      }
-      if (session.tags && session.tags.length > 0) {
-        session.tags.forEach((t) => {
-          const cls = getTagClass(t);
-          tagItems.push(`<span class="session-tag${cls ? " " + cls : ""}">${escapeHtml(t)}</span>`);
-        });
-      }
-      const tagsHtml = tagItems.length > 0
-        ? `<span class="session-tags">${tagItems.join("")}</span>`
-        : "";
-
-      // Speaker with avatar
-      let speakerHtml = "";
-      if (session.speaker) {
-        const avatarHtml = session.speakerImage
-          ? `<img class="session-speaker-avatar" src="${escapeHtml(session.speakerImage)}" alt="${escapeHtml(session.speaker)}" loading="lazy">`
-          : "";
-        speakerHtml = `<span class="session-speaker">${avatarHtml}${escapeHtml(session.speaker)}</span>`;
-      }
-
-      // Checkbox - only for non-break sessions
-      const checkboxHtml = !isNonSession
-        ? `<input type="checkbox" class="session-check" ${checkedSessions.has(session.id) ? "checked" : ""} data-session-id="${session.id}">`
-        : "";
-
-      // Content: 時間 → タグ → タイトル → 登壇者 の順
-      cell.innerHTML = `
-        <span class="session-time-label">${session.start}-${session.end}</span>
-        ${tagsHtml}
-        <span class="session-title">${escapeHtml(session.title)}</span>
-        ${speakerHtml}
-        ${checkboxHtml}
-      `;
-
-      // Click handler
-      if (!isNonSession) {
-        cell.addEventListener("click", (e) => {
-          if (editMode) return;
-          if (e.target.classList.contains("session-check")) return;
-          openModal(session);
-        });
-      }
-
-      timetableEl.appendChild(cell);
+      const cell = createSessionCell(session);
+      if (cell) timetableEl.appendChild(cell);
     });
 
     // === Bottom Header Row ===
@@ -459,6 +475,9 @@
       th.innerHTML = `${track.name}<span class="track-hashtag"><a href="${hashtagXUrl}" target="_blank" rel="noopener">${track.hashtag}</a></span>`;
       timetableEl.appendChild(th);
     });
+
+    // Keep the active search filter across re-renders
+    if (searchIndex) applySearchFilter();
   }
 
   // --- Modal ---
@@ -634,6 +653,272 @@
     updateBlockedSessions();
   });
 
+  // --- Search (search_index.py で生成した転置インデックスを使用) ---
+  // 正規化は search_index.py の normalize_text / tokenize と同じ規則に揃える
+  const SEARCH_TOKEN_SPLIT_RE = /[^0-9a-zぁ-ゖー一-鿿々]+/;
+
+  function normalizeSearchText(str) {
+    return str
+      .normalize("NFKC")
+      .toLowerCase()
+      .replace(/[ァ-ヶ]/g, (ch) => String.fromCharCode(ch.charCodeAt(0) - 0x60));
+  }
+
+  function searchTokens(str) {
+    return normalizeSearchText(str).split(SEARCH_TOKEN_SPLIT_RE).filter(Boolean);
+  }
+
+  function getSessionSearchText(session) {
+    let text = searchTextCache.get(session.id);
+    if (text === undefined) {
+      text = normalizeSearchText([session.title, session.speaker, ...(session.tags || [])].join(" "));
+      searchTextCache.set(session.id, text);
+    }
+    return text;
+  }
+
+  // Intersect two ascending posting lists
+  function intersectPostings(a, b) {
+    const result = [];
+    let i = 0;
+    let j = 0;
+    while (i < a.length && j < b.length) {
+      if (a[i] === b[j]) {
+        result.push(a[i]);
+        i++;
+        j++;
+      } else if (a[i] < b[j]) {
+        i++;
+      } else {
+        j++;
+      }
+    }
+    return result;
+  }
+
+  // Set the index and derive single-char postings once, so 1-char queries (e.g. one kanji) are a lookup
+  function setSearchIndex(index) {
+    const charDocs = new Map();
+    Object.entries(index.grams).forEach(([gram, postings]) => {
+      for (const ch of gram) {
+        if (!charDocs.has(ch)) charDocs.set(ch, new Set());
+        const docs = charDocs.get(ch);
+        postings.forEach((d) => docs.add(d));
+      }
+    });
+    searchCharPostings = new Map();
+    charDocs.forEach((docs, ch) => {
+      searchCharPostings.set(ch, Array.from(docs).sort((a, b) => a - b));
+    });
+    searchIndex = index;
+  }
+
+  function tokenPostings(token) {
+    const n = searchIndex.gram;
+    if (token.length < n) return searchCharPostings.get(token) || [];
+    let postings = null;
+    for (let i = 0; i <= token.length - n; i++) {
+      const list = searchIndex.grams[token.slice(i, i + n)];
+      if (!list) return [];
+      postings = postings === null ? list : intersectPostings(postings, list);
+      if (postings.length === 0) return [];
+    }
+    return postings;
+  }
+
+  // Returns the Set of matching session ids, or null when no filter is active
+  function searchSessions(query, tag) {
+    if (!searchIndex || !timetableData) return null;
+    const tokens = searchTokens(query);
+    if (tokens.length === 0 && !tag) return null;
+
+    let postings = tag ? searchIndex.tags[tag] || [] : null;
+    for (const token of tokens) {
+      const list = tokenPostings(token);
+      postings = postings === null ? list : intersectPostings(postings, list);
+      if (postings.length === 0) break;
+    }
+
+    // Only docs of the event currently shown; bi-gram hits are verified against the session text
+    const eventIdx = searchIndex.events.findIndex((e) => e.date === timetableData.event.date);
+    const sessionsById = new Map(timetableData.sessions.map((s) => [s.id, s]));
+    const matched = new Set();
+    postings.forEach((docIdx) => {
+      const [docEvent, sessionId] = searchIndex.docs[docIdx];
+      if (docEvent !== eventIdx) return;
+      const session = sessionsById.get(sessionId);
+      if (!session) return;
+      const text = getSessionSearchText(session);
+      if (tokens.every((t) => text.includes(t))) {
+        matched.add(sessionId);
+      }
+    });
+    return matched;
+  }
+
+  function applySearchFilter() {
+    const matched = searchSessions(searchInput.value, searchTagSelect.value);
+    timetableEl.querySelectorAll(".session-cell").forEach((cell) => {
+      const id = parseInt(cell.dataset.sessionId, 10);
+      cell.classList.toggle("search-miss", matched !== null && !matched.has(id));
+    });
+  }
+
+  async function loadSearchIndex() {
+    try {
+      const resp = await fetch("search-index.json");
+      if (!resp.ok) throw new Error(`HTTP ${resp.status}`);
+      setSearchIndex(await resp.json());
+    } catch (err) {
+      // Search is optional; keep the search box hidden when the index is unavailable
+      console.warn("search-index.json の読み込みに失敗しました:", err);
+      return;
+    }
+
+    Object.keys(searchIndex.tags).forEach((tag) => {
+      const opt = document.createElement("option");
+      opt.value = tag;
+      opt.textContent = tag;
+      searchTagSelect.appendChild(opt);
+    });
+    searchInput.addEventListener("input", applySearchFilter);
+    searchTagSelect.addEventListener("change", applySearchFilter);
+    searchBox.classList.remove("hidden");
+    requestAnimationFrame(updateLayoutHeights);
+  }
+
+  async function refreshSearchIndex() {
+    if (!searchIndex) return;
+    try {
+      const resp = await fetch("search-index.json", { cache: "no-cache" });
+      if (!resp.ok) throw new Error(`HTTP ${resp.status}`);
+      setSearchIndex(await resp.json());
+    } catch (err) {
+      console.warn("search-index.json の再読み込みに失敗しました:", err);
+      return;
+    }
+    applySearchFilter();
+  }
+
+  // --- Live Updates (live_updates.py が生成する JSON Patch を適用) ---
+  function decodePointer(path) {
+    return path.split("/").slice(1).map((k) => k.replace(/~1/g, "/").replace(/~0/g, "~"));
+  }
+
+  // Apply RFC 6902 add / remove / replace operations in place
+  function applyJsonPatch(doc, ops) {
+    ops.forEach((op) => {
+      const keys = decodePointer(op.path);
+      const last = keys.pop();
+      const parent = keys.reduce((node, k) => node[k], doc);
+      if (Array.isArray(parent)) {
+        const idx = last === "-" ? parent.length : Number(last);
+        if (op.op === "add") parent.splice(idx, 0, op.value);
+        else if (op.op === "remove") parent.splice(idx, 1);
+        else if (op.op === "replace") parent[idx] = op.value;
+        else throw new Error(`Unsupported patch op: ${op.op}`);
+      } else {
+        if (op.op === "add" || op.op === "replace") parent[last] = op.value;
+        else if (op.op === "remove") delete parent[last];
+        else throw new Error(`Unsupported patch op: ${op.op}`);
+      }
+    });
+  }
+
+  async function reloadTimetable() {
+    const resp = await fetch("timetable.json", { cache: "no-cache" });
+    if (!resp.ok) throw new Error(`HTTP ${resp.status}`);
+    timetableData = await resp.json();
+    searchTextCache.clear();
+    renderTimetable();
+    updateCurrentTimeLine();
+    refreshSearchIndex();
+  }
+
+  // Poll the manifest (conditional GET) and apply only the patches newer than the loaded data
+  async function checkForUpdates() {
+    if (!timetableData || editMode || isCheckingUpdates) return;
+    isCheckingUpdates = true;
+    try {
+      const headers = manifestEtag ? { "If-None-Match": manifestEtag } : {};
+      const resp = await fetch(UPDATES_MANIFEST_URL, { cache: "no-store", headers });
+      if (resp.status === 304) return;
+      if (!resp.ok) throw new Error(`HTTP ${resp.status}`);
+      // The ETag is remembered only once this manifest has been fully applied;
+      // otherwise a failed patch fetch would be masked by 304s on the next polls
+      const etag = resp.headers.get("ETag");
+      const manifest = await resp.json();
+
+      const currentVersion = timetableData.version || 0;
+      if (manifest.version <= currentVersion) {
+        manifestEtag = etag;
+        return;
+      }
+
+      // Patches older than the loaded data were already applied; a gap means a full reload
+      const pending = manifest.patches.filter((p) => p.from >= currentVersion);
+      if (pending.length === 0 || pending[0].from !== currentVersion) {
+        await reloadTimetable();
+        manifestEtag = etag;
+        return;
+      }
+
+      const patches = await Promise.all(
+        pending.map(async (p) => {
+          const r = await fetch(UPDATES_DIR + p.file);
+          if (!r.ok) throw new Error(`HTTP ${r.status}`);
+          return r.json();
+        })
+      );
+
+      // Only replace ops inside a single session can be re-rendered cell by cell
+      const updated = structuredClone(timetableData);
+      const changedIdx = new Set();
+      const staleIds = new Set();
+      let needsFullRender = false;
+      let searchFieldsChanged = false;
+      patches.forEach((patch) => {
+        patch.ops.forEach((op) => {
+          const m = op.path.match(/^\/sessions\/(\d+)(\/([^/]+))?/);
+          if (op.op === "replace" && m) {
+            const idx = Number(m[1]);
+            changedIdx.add(idx);
+            staleIds.add(updated.sessions[idx].id);
+            if (!m[3] || ["title", "speaker", "tags"].includes(m[3])) searchFieldsChanged = true;
+          } else {
+            needsFullRender = true;
+            searchFieldsChanged = true;
+          }
+        });
+        applyJsonPatch(updated, patch.ops);
+        updated.version = patch.to;
+      });
+
+      timetableData = updated;
+      searchTextCache.clear();
+      if (needsFullRender) {
+        renderTimetable();
+        updateCurrentTimeLine();
+      } else {
+        staleIds.forEach((id) => {
+          const cell = timetableEl.querySelector(`.session-cell[data-session-id="${id}"]`);
+          if (cell) cell.remove();
+        });
+        changedIdx.forEach((idx) => {
+          const cell = createSessionCell(timetableData.sessions[idx]);
+          if (cell) timetableEl.appendChild(cell);
+        });
+        if (searchIndex) applySearchFilter();
+      }
+      if (searchFieldsChanged) refreshSearchIndex();
+      manifestEtag = etag;
+    } catch (err) {
+      console.warn("タイムテーブルの更新確認に失敗しました:", err);
+    } finally {
+      isCheckingUpdates = false;
+    }
+  }
+
   // --- Current Time Line Indicator ---
   function updateCurrentTimeLine() {
     let line = timetableEl.querySelector(".current-time-line");
@@ -904,6 +1189,14 @@
     applyDebugTime(`${EVENT_DATE}T09:00`);
   }
 
+  // --- Service Worker (build_assets.py が生成したプリキャッシュ一覧でオフライン対応) ---
+  function registerServiceWorker() {
+    if (!("serviceWorker" in navigator)) return;
+    navigator.serviceWorker.register("sw.js").catch((err) => {
+      console.warn("Service Worker の登録に失敗しました:", err);
+    });
+  }
+
   // --- Init ---
   async function init() {
     setupDebugPanel();
@@ -930,12 +1223,15 @@
     updateCurrentTimeLine(); // draw current time line immediately on load
     updateEventStatus();
     autoScrollToCurrentTime();
+    loadSearchIndex();
+    registerServiceWorker();
 
     // Periodically check for current sessions and event status
     setInterval(() => {
       updateCurrentSessions();
       updateCurrentTimeLine();
       updateEventStatus();
+      checkForUpdates();
     }, CURRENT_CHECK_INTERVAL);
   }
 
@@ -0,0 +1,110 @@
+// JAWS DAYS 2026 Timetable Service Worker
+//
+// build_assets.py がプリキャッシュ一覧 ([{url, revision}]) を埋め込む (__PRECACHE_MANIFEST)。
+// ビルドしていない public/ をそのまま配信した場合は一覧が空になり、何もキャッシュしない。
+// キャッシュキーに revision を含めるため、再インストール時は revision が変わったファイルだけを取得する。
+// fortee.jp のスピーカー画像はインストール対象にせず、表示時に別キャッシュへ保存する
+// (stale-while-revalidate、件数上限あり)。
+"use strict";
+
+const CACHE_NAME = "jawsdays2026-precache";
+const IMAGE_CACHE_NAME = "jawsdays2026-speaker-images";
+const IMAGE_ORIGIN = "https://fortee.jp";
+// Opaque responses are padded heavily against the storage quota, so keep the image cache bounded
+const MAX_IMAGE_ENTRIES = 80;
+const PRECACHE_MANIFEST = self.__PRECACHE_MANIFEST || [];
+const INDEX_URL = new URL("index.html", self.location).href;
+
+// Absolute URL -> cache key (URL + revision)
+const precacheKeys = new Map(
+  PRECACHE_MANIFEST.map((entry) => {
+    const url = new URL(entry.url, self.location).href;
+    const key = entry.revision ? `${url}${url.includes("?") ? "&" : "?"}__rev=${entry.revision}` : url;
+    return [url, key];
+  })
+);
+
+self.addEventListener("install", (event) => {
+  event.waitUntil(
+    caches
+      .open(CACHE_NAME)
+      .then((cache) =>
+        Promise.all(
+          Array.from(precacheKeys).map(async ([url, key]) => {
+            if (await cache.match(key)) return; // unchanged since the previous build
+            const resp = await fetch(url, { cache: "no-cache" });
+            if (!resp.ok) throw new Error(`HTTP ${resp.status}: ${url}`);
+            await cache.put(key, resp);
+          })
+        )
+      )
+      .then(() => self.skipWaiting())
+  );
+});
+
+self.addEventListener("activate", (event) => {
+  const validKeys = new Set(precacheKeys.values());
+  event.waitUntil(
+    caches
+      .open(CACHE_NAME)
+      .then(async (cache) => {
+        const requests = await cache.keys();
+        await Promise.all(requests.filter((r) => !validKeys.has(r.url)).map((r) => cache.delete(r)));
+      })
+      .then(() => self.clients.claim())
+  );
+});
+
+// Drop the oldest entries once the image cache grows past MAX_IMAGE_ENTRIES
+async function trimImageCache(cache) {
+  const requests = await cache.keys();
+  await Promise.all(
+    requests.slice(0, Math.max(0, requests.length - MAX_IMAGE_ENTRIES)).map((r) => cache.delete(r))
+  );
+}
+
+// Stale-while-revalidate: serve the cached image and refresh it in the background, so a bad
+// response cached on flaky Wi-Fi (opaque responses hide their status) is replaced on the next view
+async function speakerImageResponse(event) {
+  const cache = await caches.open(IMAGE_CACHE_NAME);
+  const cached = await cache.match(event.request);
+  const network = fetch(event.request).then(async (resp) => {
+    if (resp.ok || resp.type === "opaque") {
+      try {
+        await cache.put(event.request, resp.clone());
+        await trimImageCache(cache);
+      } catch (err) {
+        console.warn("speaker image not cached:", event.request.url, err);
+      }
+    }
+    return resp;
+  });
+  if (cached) {
+    event.waitUntil(network.catch(() => {}));
+    return cached;
+  }
+  return network;
+}
+
+self.addEventListener("fetch", (event) => {
+  const request = event.request;
+  if (request.method !== "GET") return;
+
+  if (request.destination === "image" && new URL(request.url).origin === IMAGE_ORIGIN) {
+    event.respondWith(speakerImageResponse(event));
+    return;
+  }
+
+  let key = precacheKeys.get(request.url);
+  // Navigations (including ?mode=debug or share URLs) are served from the precached index.html
+  if (!key && request.mode === "navigate") key = precacheKeys.get(INDEX_URL);
+  if (!key) return;
+
+  // Explicit revalidation (e.g. live update reloads) goes to the network first
+  if (request.cache === "no-cache" || request.cache === "no-store" || request.cache === "reload") {
+    event.respondWith(fetch(request).catch(() => caches.match(key)));
+    return;
+  }
+
+  event.respondWith(caches.match(key).then((cached) => cached || fetch(request)));
+});
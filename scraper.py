@@ -21,9 +21,9 @@ fortee.jp の HTML 構造:
 
 出力:
   public/timetable.json
+  public/updates/ (live_updates.py で生成する差分パッチとマニフェスト)
 """
 
-import json
 import re
 import sys
 import time
@@ -47,6 +47,8 @@ except ImportError:
     print("  pip install beautifulsoup4")
     sys.exit(1)
 
+from live_updates import save_timetable
+
 TIMETABLE_URL = "https://fortee.jp/jawsdays-2026/timetable"
 FORTEE_BASE_URL = "https://fortee.jp"
 EVENT_DATE = "2026-03-07"
@@ -163,6 +165,7 @@ def parse_sessions(html):
         title = ""
         proposal_url = ""
         speaker = ""
+        speaker_image = ""
         tags = []
 
         if is_proposal:
@@ -189,6 +192,15 @@ def parse_sessions(html):
         if speaker_el:
             speaker = speaker_el.get_text(strip=True)
 
+        # スピーカー画像取得
+        avatar_el = div.select_one(".speaker img.avatar")
+        if avatar_el:
+            src = avatar_el.get("src", "")
+            if src.startswith("/"):
+                speaker_image = FORTEE_BASE_URL + src
+            elif src.startswith("http"):
+                speaker_image = src
+
         # タグ取得 (Level バッジ等)
         badge_els = div.select(".badge")
         for badge in badge_els:
@@ -203,6 +215,7 @@ def parse_sessions(html):
             "title": title,
             "speaker": speaker,
             "url": proposal_url,
+            "speaker_image": speaker_image,
             "tags": tags,
             "is_proposal": is_proposal,
         })
@@ -243,6 +256,7 @@ def build_output(deduped_sessions):
             "speaker": s["speaker"],
             "proposalUrl": s["url"],
             "tags": s["tags"],
+            "speakerImage": s["speaker_image"],
         })
 
     return {
@@ -277,13 +291,8 @@ def main():
 
         deduped = deduplicate_sessions(raw_sessions)
         output = build_output(deduped)
-
-        OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
-        OUTPUT_PATH.write_text(
-            json.dumps(output, ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
-        print(f"Success: {len(deduped)} sessions saved to {OUTPUT_PATH}")
+        version = save_timetable(output, OUTPUT_PATH)
+        print(f"Success: {len(deduped)} sessions (version {version}) saved to {OUTPUT_PATH}")
 
         # サマリー表示
         for letter in "ABCDEFGH":
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+JAWS DAYS 2026 Timetable Search Index Builder
+
+timetable.json からクライアントサイド検索用の転置インデックスを生成するスクリプト。
+
+日本語タイトルには単語境界がないため、正規化した文字列を文字 bi-gram に分割して
+インデックス化します。フロントエンドはクエリの bi-gram のポスティングを積集合するだけで
+候補セッションを得られるため、キー入力ごとに全セッションを走査する必要がありません。
+
+正規化:
+  - NFKC 正規化 (全角英数 → 半角、半角カナ → 全角カナ)
+  - 英字は小文字化
+  - カタカナ → ひらがな
+  - 空白・記号で区切られた単語ごとに bi-gram を生成 (1文字の単語はそのまま)
+
+出力フォーマット (search-index.json):
+  {
+    "version": 1,
+    "gram": 2,
+    "events": [{"name": ..., "date": ...}, ...],
+    "docs": [[event_index, session_id], ...],
+    "grams": {"bi-gram": [doc_index, ...], ...},
+    "tags": {"タグ名": [doc_index, ...], ...}
+  }
+
+  ポスティングは doc_index の昇順。複数イベントのデータを1つのインデックスにまとめられます。
+
+デプロイされるインデックスは build_assets.py がビルド時に dist/timetable.json から生成します。
+このスクリプト単体の実行はローカル開発用です (public/search-index.json はコミットしない)。
+
+使い方:
+  python search_index.py
+
+出力:
+  public/search-index.json
+"""
+
+import json
+import re
+import unicodedata
+from pathlib import Path
+
+INDEX_VERSION = 1
+GRAM_SIZE = 2
+TIMETABLE_PATH = Path(__file__).parent / "public" / "timetable.json"
+OUTPUT_PATH = Path(__file__).parent / "public" / "search-index.json"
+
+# インデックス対象のフィールド
+SEARCH_FIELDS = ("title", "speaker", "tags")
+
+# 区切り文字: 空白と、英数字・かな・漢字以外の記号
+TOKEN_SPLIT_RE = re.compile(r"[^0-9a-zぁ-ゖー一-鿿々]+")
+
+KATAKANA_START = 0x30A1
+KATAKANA_END = 0x30F6
+KANA_OFFSET = 0x60
+
+
+def normalize_text(text):
+    """検索用に文字列を正規化する (NFKC + 小文字化 + カタカナ→ひらがな)"""
+    text = unicodedata.normalize("NFKC", text).lower()
+    return "".join(
+        chr(ord(ch) - KANA_OFFSET) if KATAKANA_START <= ord(ch) <= KATAKANA_END else ch
+        for ch in text
+    )
+
+
+def tokenize(text):
+    """正規化済み文字列を記号・空白で単語に分割する"""
+    return [token for token in TOKEN_SPLIT_RE.split(text) if token]
+
+
+def ngrams(text, n=GRAM_SIZE):
+    """文字列から文字 n-gram の集合を生成する。n 文字未満の単語はそのまま使う"""
+    grams = set()
+    for token in tokenize(normalize_text(text)):
+        if len(token) < n:
+            grams.add(token)
+            continue
+        for i in range(len(token) - n + 1):
+            grams.add(token[i:i + n])
+    return grams
+
+
+def session_text(session):
+    """インデックス対象フィールドを連結した文字列を返す"""
+    parts = []
+    for field in SEARCH_FIELDS:
+        value = session.get(field)
+        if isinstance(value, list):
+            parts.extend(value)
+        elif value:
+            parts.append(value)
+    return " ".join(parts)
+
+
+def build_search_index(timetables):
+    """1つ以上の timetable.json の内容から検索インデックスを構築する"""
+    events = []
+    docs = []
+    grams = {}
+    tags = {}
+
+    for event_idx, timetable in enumerate(timetables):
+        event = timetable.get("event", {})
+        events.append({"name": event.get("name", ""), "date": event.get("date", "")})
+
+        for session in timetable.get("sessions", []):
+            doc_idx = len(docs)
+            docs.append([event_idx, session["id"]])
+
+            for gram in ngrams(session_text(session)):
+                grams.setdefault(gram, []).append(doc_idx)
+
+            for tag in session.get("tags", []):
+                tag = tag.strip()
+                if tag:
+                    tags.setdefault(tag, []).append(doc_idx)
+
+    return {
+        "version": INDEX_VERSION,
+        "gram": GRAM_SIZE,
+        "events": events,
+        "docs": docs,
+        "grams": dict(sorted(grams.items())),
+        "tags": dict(sorted(tags.items())),
+    }
+
+
+def write_search_index(index, path=OUTPUT_PATH):
+    """検索インデックスをコンパクトな JSON として書き出す"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        json.dumps(index, ensure_ascii=False, separators=(",", ":")),
+        encoding="utf-8",
+    )
+
+
+def main():
+    timetable = json.loads(TIMETABLE_PATH.read_text(encoding="utf-8"))
+    index = build_search_index([timetable])
+    write_search_index(index)
+    print(
+        f"Success: {len(index['docs'])} sessions, {len(index['grams'])} grams, "
+        f"{len(index['tags'])} tags saved to {OUTPUT_PATH}"
+    )
+
+
+if __name__ == "__main__":
+    main()